@@ -1,5 +1,27 @@
-from .parser_con import parse_con
-from .parser_raw import parse_raw
-from .parser_inl import parse_inl
-from .parser_rop import parse_rop
-from .main import parse_data, build_references, get_solution_1, get_solution_2
\ No newline at end of file
+import importlib
+
+# Public functions and the submodule that defines them, loaded on first access
+_EXPORTS = {
+    "parse_con": "parser_con",
+    "parse_raw": "parser_raw",
+    "parse_inl": "parser_inl",
+    "parse_rop": "parser_rop",
+    "parse_data": "main",
+    "parse_data_incremental": "main",
+    "build_references": "main",
+    "get_solution_1": "main",
+    "get_solution_2": "main",
+    "write_case": "writer_raw",
+    "write_case_batch": "writer_raw",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
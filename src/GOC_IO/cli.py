@@ -0,0 +1,142 @@
+import os
+import sys
+import argparse
+
+def parse(directory: str, args: argparse.Namespace) -> str:
+    """Parse a case directory, optionally storing the result as a pickle cache
+
+    Args:
+        directory (str): file directory with case.* files
+        args (argparse.Namespace): command line options
+
+    Returns:
+        str: summary of the parsed case
+    """
+    from .main import parse_data
+    network = parse_data(directory)
+
+    summary = f"{directory}: {len(network[0]['buses'])} buses, {len(network[0]['generators'])} generators, {len(network) - 1} contingencies"
+    if args.cache:
+        import pickle
+        filename = os.path.join(_output_dir(directory, args), "case.pkl")
+        with open(filename, "wb") as f:
+            pickle.dump(network, f, protocol=pickle.HIGHEST_PROTOCOL)
+        summary += f" -> {filename}"
+    return summary
+
+def write(directory: str, args: argparse.Namespace) -> str:
+    """Write solution1.txt and/or solution2.txt of a case directory
+
+    Args:
+        directory (str): file directory with case.* files
+        args (argparse.Namespace): command line options
+
+    Returns:
+        str: summary of the written files
+    """
+    from .main import parse_data, get_solution_1, get_solution_2
+    network = parse_data(directory)
+
+    solutions = []
+    if args.solution in ("1", "all"):
+        solutions.append(("solution1.txt", get_solution_1(network)))
+    if args.solution in ("2", "all"):
+        solutions.append(("solution2.txt", get_solution_2(network, processes=args.processes)))
+
+    filenames = []
+    for name, solution in solutions:
+        filename = os.path.join(_output_dir(directory, args), name)
+        with open(filename, "w") as f:
+            f.write(solution)
+        filenames.append(filename)
+    return f"{directory}: " + ", ".join(filenames)
+
+COMMANDS = {
+    "parse": parse,
+    "write": write,
+}
+
+def _output_dir(directory: str, args: argparse.Namespace) -> str:
+    if args.output_dir is None:
+        return directory
+    # One sub directory per case when several cases share the output directory
+    output_dir = args.output_dir
+    if len(args.directories) > 1:
+        output_dir = os.path.join(output_dir, args.output_names[directory])
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+def _output_names(directories: list) -> dict:
+    # Leaf name of each directory, the path from their common parent if leaf names repeat
+    names = [os.path.basename(os.path.normpath(directory)) for directory in directories]
+    if len(set(names)) < len(names):
+        paths = [os.path.abspath(directory) for directory in directories]
+        common = os.path.commonpath(paths)
+        names = [os.path.relpath(path, common) for path in paths]
+    if len(set(names)) < len(names):
+        raise ValueError("Repeated case directories share the same output directory")
+    return dict(zip(directories, names))
+
+def _run(command: str, directory: str, args: argparse.Namespace) -> str:
+    return COMMANDS[command](directory, args)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="goc-io", description="Read and write GOC 1 files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("directories", nargs="+", metavar="DIRECTORY", help="directory with case.* files")
+    common.add_argument("-j", "--jobs", type=int, default=1, help="number of directories processed in parallel")
+    common.add_argument("-o", "--output-dir", default=None, help="output directory (Default: the case directory)")
+
+    parse_parser = subparsers.add_parser("parse", parents=[common], help="parse case directories")
+    parse_parser.add_argument("--cache", action="store_true", help="store the parsed case as case.pkl")
+
+    write_parser = subparsers.add_parser("write", parents=[common], help="write solution files")
+    write_parser.add_argument("-s", "--solution", choices=["1", "2", "all"], default="all", help="solution file to write (Default: all)")
+    write_parser.add_argument("-p", "--processes", type=int, default=1, help="worker processes used by solution 2")
+
+    return parser
+
+def main(argv: list = None) -> int:
+    """Entry point of the `goc-io` command
+
+    Args:
+        argv (list): command line arguments (Default: sys.argv[1:])
+
+    Returns:
+        int: exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.output_names = {}
+    if args.output_dir is not None and len(args.directories) > 1:
+        try:
+            args.output_names = _output_names(args.directories)
+        except ValueError as error:
+            parser.error(str(error))
+
+    status = 0
+    if args.jobs > 1 and len(args.directories) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(_run, args.command, directory, args) for directory in args.directories]
+            results = [(directory, future.exception() or future.result()) for directory, future in zip(args.directories, futures)]
+    else:
+        results = []
+        for directory in args.directories:
+            try:
+                results.append((directory, _run(args.command, directory, args)))
+            except Exception as error:
+                results.append((directory, error))
+
+    for directory, result in results:
+        if isinstance(result, Exception):
+            print(f"{directory}: {result}", file=sys.stderr)
+            status = 1
+        else:
+            print(result)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
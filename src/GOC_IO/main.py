@@ -1,11 +1,23 @@
 import os
 import math
+import hashlib
 from copy import deepcopy
+from . import parser_con, parser_inl, parser_raw, parser_rop
 from .parser_con import parse_con
 from .parser_inl import parse_inl
 from .parser_raw import parse_raw
 from .parser_rop import parse_rop
 
+COMPONENTS = list(parser_raw.COMPONENTS)
+
+# File extension -> (block splitter, block reader)
+SECTIONS = {
+    "raw": (parser_raw.split_case, parser_raw.read_section),
+    "rop": (parser_rop.split_rop, parser_rop.read_section),
+    "con": (parser_con.split_con, parser_con.read_section),
+    "inl": (parser_inl.split_inl, parser_inl.read_section),
+}
+
 def parse_data(directory: str) -> dict:
     """return a mapping with the case info, one dict entry per scenario
 
@@ -15,51 +27,117 @@ def parse_data(directory: str) -> dict:
     Returns:
         dict: network mapping
     """
-    files = os.listdir(directory)
-    contingencies, participation_factor, cost, network = False, False, False, False
-    for file in files:
-        fullpath = os.path.join(directory, file)
+    files = _find_files(directory)
+    contingencies = parse_con(files["con"])
+    participation_factor = parse_inl(files["inl"])
+    cost = parse_rop(files["rop"])
+    network = parse_raw(files["raw"])
 
-        if file.endswith(".con"):
-            contingencies = parse_con(fullpath)
+    _add_generator_data(network["generators"], cost, participation_factor)
+    return _build_scenarios(network, contingencies)
 
-        if file.endswith(".inl"):
-            participation_factor = parse_inl(fullpath)
-        
-        if file.endswith(".rop"):
-            cost = parse_rop(fullpath)
+def parse_data_incremental(directory: str, previous: dict = None) -> dict:
+    """Parse a case directory reusing what did not change since a previous call
 
-        if file.endswith(".raw"):
-            network = parse_raw(fullpath)
+    Each data block of the *.raw and *.rop files, the contingency list and the
+    participation factors are fingerprinted. Only the blocks whose fingerprint
+    changed are parsed again and only the components read from them are
+    replaced in the scenarios of `previous`, which are updated in place.
+    A change in the contingencies or in the case identification data rebuilds
+    the scenarios as `parse_data` does.
 
-    if not contingencies:
-        raise ValueError(f"*.con file does not found in {directory}")
-
-    if not participation_factor:
-        raise ValueError(f"*.inl file does not found in {directory}")
+    Args:
+        directory (str): file directory with case.* files
+        previous (dict): result of a previous call (Default: None -> parse everything)
 
-    if not cost:
-        raise ValueError(f"*.rop file does not found in {directory}")
-    
-    if not network:
-        raise ValueError(f"*.raw file does not found in {directory}")
-        
-    for gen in network["generators"]:
-        network["generators"][gen]["cost"] = cost[gen]
-        network["generators"][gen]["alpha_g"] = participation_factor[gen]["alpha_g"]
-
-    all_components = (
-        list(network["buses"].values())
-        + list(network["loads"].values())
-        + list(network["fixed_shunts"].values())
-        + list(network["generators"].values())
-        + list(network["lines"].values())
-        + list(network["transformers"].values())
-        + list(network["switched_shunts"].values())
-    )
-
-    for component in all_components:
-        component["contingency"] = False
+    Returns:
+        dict: `scenarios` (network mapping as in `parse_data`), `report` (changed
+            blocks per file extension, updated `components` and whether the
+            scenarios were `rebuilt`) and the fingerprints and parsed blocks
+            used by the next call
+    """
+    files = _find_files(directory)
+    previous = previous or {}
+    previous_fingerprints = previous.get("fingerprints", {})
+    previous_sections = previous.get("sections", {})
+
+    fingerprints, sections, report = {}, {}, {}
+    for extension, (split, read_section) in SECTIONS.items():
+        fingerprints[extension], sections[extension], report[extension] = _reparse_sections(
+            split(files[extension]),
+            read_section,
+            previous_fingerprints.get(extension, {}),
+            previous_sections.get(extension, {})
+        )
+
+    case33 = {key: [] for key in parser_raw.DATA}
+    case33.update(sections["raw"])
+    contingencies = sections["con"]["CONTINGENCY"]
+    participation_factor = sections["inl"]["PARTICIPATION FACTOR"]
+    cost = parser_rop.build_cost(sections["rop"])
+
+    report["rebuilt"] = "scenarios" not in previous or bool(report["con"]) or "HEADER" in report["raw"]
+    if report["rebuilt"]:
+        network = parser_raw.build_case(case33)
+        _add_generator_data(network["generators"], cost, participation_factor)
+        scenarios = _build_scenarios(network, contingencies)
+        report["components"] = list(COMPONENTS)
+    else:
+        scenarios = previous["scenarios"]
+        report["components"] = [
+            component for component in COMPONENTS
+            if set(parser_raw.COMPONENT_SECTIONS[component]) & set(report["raw"])
+            or component == "generators" and (set(parser_rop.READERS) & set(report["rop"]) or report["inl"])
+        ]
+        s_base = float(case33["HEADER"]["SBASE"])
+        for component in report["components"]:
+            data = parser_raw.COMPONENTS[component](case33, s_base)
+            if component == "generators":
+                _add_generator_data(data, cost, participation_factor)
+            _update_component(scenarios, component, data)
+
+    return {
+        "scenarios": scenarios,
+        "fingerprints": fingerprints,
+        "sections": sections,
+        "report": report,
+    }
+
+def _find_files(directory: str) -> dict:
+    files = {}
+    for file in os.listdir(directory):
+        extension = os.path.splitext(file)[1][1:]
+        if extension in SECTIONS:
+            files[extension] = os.path.join(directory, file)
+
+    for extension in ["con", "inl", "rop", "raw"]:
+        if extension not in files:
+            raise ValueError(f"*.{extension} file does not found in {directory}")
+    return files
+
+def _reparse_sections(sections: dict, read_section, fingerprints: dict, parsed: dict) -> tuple:
+    new_fingerprints, new_parsed, changed = {}, {}, []
+    for key, section in sections.items():
+        new_fingerprints[key] = hashlib.sha1(section.encode()).hexdigest()
+        if fingerprints.get(key) == new_fingerprints[key]:
+            new_parsed[key] = parsed[key]
+        else:
+            new_parsed[key] = read_section(key, section)
+            changed.append(key)
+
+    # Removed blocks
+    changed.extend(key for key in fingerprints if key not in sections)
+    return new_fingerprints, new_parsed, changed
+
+def _add_generator_data(generators: dict, cost: dict, participation_factor: dict):
+    for gen in generators:
+        generators[gen]["cost"] = cost[gen]
+        generators[gen]["alpha_g"] = participation_factor[gen]["alpha_g"]
+
+def _build_scenarios(network: dict, contingencies: list) -> dict:
+    for component in COMPONENTS:
+        for data in network[component].values():
+            data["contingency"] = False
 
     scenarios = {}
     scenarios[0] = network
@@ -72,17 +150,29 @@ def parse_data(directory: str) -> dict:
         scenarios[i]["network_id"] = i
         scenarios[i]["delta_k"] = 0
 
-        if contingency["event"] == "Generator Out-of-Service":
-            component = "generators"
-
-        if contingency["event"] == "Branch Out-of-Service":
-            index = contingency["id"]
-            component = "lines" if index in scenarios[i]["lines"].keys() else "transformers"
-
+        component = _get_contingency_component(scenarios[i], contingency)
         scenarios[i][component][contingency["id"]]["contingency"] = True
 
     return scenarios
 
+def _update_component(scenarios: dict, component: str, data: dict):
+    for value in data.values():
+        value["contingency"] = False
+
+    for i, network in scenarios.items():
+        network[component] = data if i == 0 else deepcopy(data)
+        contingency = network["contingency"]
+        if contingency and _get_contingency_component(network, contingency) == component:
+            network[component][contingency["id"]]["contingency"] = True
+
+def _get_contingency_component(network: dict, contingency: dict) -> str:
+    if contingency["event"] == "Generator Out-of-Service":
+        return "generators"
+
+    if contingency["event"] == "Branch Out-of-Service":
+        index = contingency["id"]
+        return "lines" if index in network["lines"].keys() else "transformers"
+
 def build_references(network: dict) -> dict:
     """bus to equipment mapping
 
@@ -123,18 +213,20 @@ def build_references(network: dict) -> dict:
     return references
 
 
-def get_solution(network: dict, network_id: int = 0) -> str:
+def get_solution(network: dict, network_id: int = 0, references: dict = None) -> str:
     """Get the base case solution according to item E in SCOPF problem formulation
 
     Args:
         network (dict): GOC1 dict type network
         network_id (int): id of the network (Default: 0 -> Base Case)
+        references (dict): output of `build_references` (Default: None -> built from `network`)
 
     Returns:
         str: Represetation of the solution
     """
     solution_str = []
-    references = build_references(network)
+    if references is None:
+        references = build_references(network)
     network = network[network_id]
 
     # Contingency section
@@ -181,19 +273,73 @@ def get_solution_1(network: dict) -> str:
     """
     return get_solution(network)
 
-def get_solution_2(network: dict) -> str:
+def get_solution_2(network: dict, processes: int = 1, mp_context=None) -> str:
     """return GOC1 solution 2
 
+    With `processes` greater than one the contingencies are split in
+    contiguous shards, each shard is formatted in a worker process and
+    the shards are merged back in contingency order, so the output is
+    identical to the serial one. Forked workers inherit the network,
+    otherwise each task carries the base case and its shard scenarios.
+
     Args:
         network (dict): GOC1 network dict
+        processes (int): number of worker processes (Default: 1 -> serial)
+        mp_context: multiprocessing context of the pool (Default: None -> default context)
 
     Returns:
         str: solution 2
     """
-    solution_str = []
-    for i in network:
-        if i == 0:
-            continue
-        solution_str.append(get_solution(network, i))
+    network_ids = [i for i in network if i != 0]
+    if processes is None or processes <= 1 or len(network_ids) < 2:
+        return _get_solution_shard(network_ids, network)
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    n_shards = min(processes, len(network_ids))
+    size, extra = divmod(len(network_ids), n_shards)
+    shards, start = [], 0
+    for k in range(n_shards):
+        stop = start + size + (1 if k < extra else 0)
+        shards.append(network_ids[start:stop])
+        start = stop
+
+    context = mp_context or multiprocessing.get_context()
+    if context.get_start_method() == "fork":
+        options = {"initializer": _init_worker, "initargs": (network,)}
+        sub_networks = [None] * n_shards
+    else:
+        # Only the base case (for references) and the shard scenarios are sent
+        options = {}
+        sub_networks = [{0: network[0], **{i: network[i] for i in ids}} for ids in shards]
+
+    with ProcessPoolExecutor(max_workers=n_shards, mp_context=context, **options) as executor:
+        solution_str = list(executor.map(_get_solution_shard, shards, sub_networks))
     return "\n".join(solution_str)
 
+# Network of the worker processes of `get_solution_2`
+_network = None
+
+def _init_worker(network: dict):
+    global _network
+    _network = network
+
+def _get_solution_shard(network_ids: list, network: dict = None) -> str:
+    """return the solution of a set of contingencies
+
+    Args:
+        network_ids (list): ids of the contingencies to write
+        network (dict): GOC1 network dict (Default: None -> network of the worker)
+
+    Returns:
+        str: solutions joined in the given order
+    """
+    if network is None:
+        network = _network
+    references = build_references(network)
+
+    solution_str = []
+    for i in network_ids:
+        solution_str.append(get_solution(network, i, references))
+    return "\n".join(solution_str)
@@ -20,6 +20,20 @@ def parse_con(filename: str) -> List[dict]:
     Returns:
         List[dict]: array with the data of the contigency (event, name, id)
 
+    Raises:
+       NameError: Invalid filename extension 
+    """
+    return read_section("CONTINGENCY", split_con(filename)["CONTINGENCY"])
+
+def split_con(filename: str) -> dict:
+    """Read a contingency file as a single data block
+
+    Args:
+        filename (str): path of the contingency file (*.con)
+
+    Returns:
+        dict: mapping from `CONTINGENCY` to the content of the file
+
     Raises:
        NameError: Invalid filename extension 
     """
@@ -29,6 +43,18 @@ def parse_con(filename: str) -> List[dict]:
     with open(filename) as io:
         file = io.read()
 
+    return {"CONTINGENCY": file}
+
+def read_section(key: str, file: str) -> List[dict]:
+    """Read the contingency list (see `parse_con`)
+
+    Args:
+        key (str): block name, always `CONTINGENCY`
+        file (str): content of the contingency file (*.con)
+
+    Returns:
+        List[dict]: array with the data of the contigency (event, name, id)
+    """
     contingencies = []
     contingencies_iterator = re.finditer(r"(?:CONTINGENCY).*?(?:END)", file, flags=re.S)
     for match in contingencies_iterator:
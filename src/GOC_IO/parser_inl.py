@@ -10,19 +10,42 @@ def parse_inl(filename: str) -> dict:
     Returns:
         dict: mapping from `g` to `alpha_g`
     """
+    return read_section("PARTICIPATION FACTOR", split_inl(filename)["PARTICIPATION FACTOR"])
+
+def split_inl(filename: str) -> dict:
+    """Read a unit inertia and governor response data file as a single data block
+
+    Args:
+        filename (str): path of the unit inertia and governor response file (*.inl)
+
+    Returns:
+        dict: mapping from `PARTICIPATION FACTOR` to the content of the file
+    """
     if not filename.endswith(".inl"):
         raise NameError("Invalid filename, `parse_inl` works with *.inl files")
 
-    participation_factor = {}
     with open(filename) as f:
-        inl_reader = csv.reader(f)
-        for row in inl_reader:
-            if len(row) == 7:
-                g = (int(row[0]), row[1].strip().rjust(2, ' ')) 
-                alpha_g = float(row[5]) 
-
-                participation_factor[g] = {
-                    "id": g,
-                    "alpha_g": alpha_g
-                }
+        return {"PARTICIPATION FACTOR": f.read()}
+
+def read_section(key: str, file: str) -> dict:
+    """Read the participation factors (see `parse_inl`)
+
+    Args:
+        key (str): block name, always `PARTICIPATION FACTOR`
+        file (str): content of the unit inertia and governor response file (*.inl)
+
+    Returns:
+        dict: mapping from `g` to `alpha_g`
+    """
+    participation_factor = {}
+    inl_reader = csv.reader(file.splitlines())
+    for row in inl_reader:
+        if len(row) == 7:
+            g = (int(row[0]), row[1].strip().rjust(2, ' ')) 
+            alpha_g = float(row[5]) 
+
+            participation_factor[g] = {
+                "id": g,
+                "alpha_g": alpha_g
+            }
     return participation_factor
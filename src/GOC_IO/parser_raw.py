@@ -70,18 +70,38 @@ def read_case(filename: str) -> dict:
     Returns:
         dict: PSSE 33 structured data
 
+    Raises:
+       NameError: Invalid filename extension 
+    """
+    case33 = {key: [] for key in DATA.keys()}
+    for key, section in split_case(filename).items():
+        case33[key] = read_section(key, section)
+    return case33
+
+def split_case(filename: str) -> dict:
+    """Split a *.raw file in its data blocks
+
+    Args:
+        filename (str): Name of psse *.raw file
+
+    Returns:
+        dict: mapping from block name (`HEADER`, `BUS`, `LOAD`, ...) to the raw text of the block
+
     Raises:
        NameError: Invalid filename extension 
     """
     if not filename.endswith(".raw"):
         raise NameError("Invalid filename, `read_case` works with *.raw files")
-    case33 = {key: [] for key in DATA.keys()}
+    sections = {}
     key = None
 
     with open(filename) as f:
         for i, line in enumerate(f):
             # Get type of data
             type_data = get_type_of_data(line) if i != 2 else "BUS"
+            if type_data == "HEADER" and i != 0:
+                type_data = None # Data line that looks like the case identification
+
             if type_data == "END":
                 break # End of file
 
@@ -89,44 +109,62 @@ def read_case(filename: str) -> dict:
                 continue # Skip comment
 
             if type_data == "HEADER":
-                parts = get_parts(line.split("/")[0], HEADERKEYS)
-                case33["HEADER"] = parts
+                sections["HEADER"] = [line]
                 continue
 
             if type_data: # Header of block data
                 key = type_data
+                sections[key] = []
+                continue
+
+            if re.match(r"0\s*/\s*END OF", line):
+                key = None # End of the last block
                 continue
 
-            # Populate dict if is in data block
             if key:
-                if key not in MULTILINECOMPONENTS:
-                    # Get parts and pad with None missing info
-                    parts = get_parts(line, DATA[key])
-
-                    # Add to the case
-                    case33[key].append(parts)
-
-                elif key == "TRANSFORMER":
-                    components = []
-                    for j, sublist in enumerate(DATA[key]):
-                        parts = get_parts(line, sublist)
-                        components.append(parts)
-                        if j < 3:
-                            line = next(f)
-                        elif j == 3:
-                            line = next(f) if components[0]["K"] != '0' else ""
-                    # Append to case
-                    case33[key].append(components)
-                else:
-                    components = []
-                    for j, sublist in enumerate(DATA[key]):
-                        parts = get_parts(line, sublist)
-                        components.append(parts)
-                        if j < len(DATA[key]) - 1:
-                            line = next(f)
-                    # Append to case
-                    case33[key].append(components)
-    return case33
+                sections[key].append(line)
+
+    return {key: "".join(lines) for key, lines in sections.items()}
+
+def read_section(key: str, section: str):
+    """Read the text of a data block
+
+    Args:
+        key (str): block name (see `DATA`)
+        section (str): raw text of the block from `split_case`
+
+    Returns:
+        dict | list: header parts for `HEADER`, list of records otherwise
+    """
+    if key == "HEADER":
+        return get_parts(section.split("/")[0], HEADERKEYS)
+
+    records = []
+    lines = iter(section.splitlines())
+    for line in lines:
+        if key not in MULTILINECOMPONENTS:
+            # Get parts and pad with None missing info
+            records.append(get_parts(line, DATA[key]))
+
+        elif key == "TRANSFORMER":
+            components = []
+            for j, sublist in enumerate(DATA[key]):
+                parts = get_parts(line, sublist)
+                components.append(parts)
+                if j < 3:
+                    line = next(lines)
+                elif j == 3:
+                    line = next(lines) if components[0]["K"] != '0' else ""
+            records.append(components)
+        else:
+            components = []
+            for j, sublist in enumerate(DATA[key]):
+                parts = get_parts(line, sublist)
+                components.append(parts)
+                if j < len(DATA[key]) - 1:
+                    line = next(lines)
+            records.append(components)
+    return records
 
 def get_type_of_data(line):
     match_end = re.search(r"^Q", line)
@@ -162,15 +200,30 @@ def parse_raw(filename: str) -> dict:
     Returns:
         dict: mapping according to SCOPF Problem Formulation
     """
-    pass
+    return build_case(read_case(filename))
+
+def build_case(case33: dict) -> dict:
+    """Representation of GOC 1 data format from PSSE 33 structured data
+
+    Args:
+        case33 (dict): PSSE 33 structured data from `read_case`
+
+    Returns:
+        dict: mapping according to SCOPF Problem Formulation
+    """
     goc_case = {}
-    case33 = read_case(filename)
 
     # Case identification data (C.2)
     goc_case["s_base"] = float(case33["HEADER"]["SBASE"])
 
+    for component, get_component in COMPONENTS.items():
+        goc_case[component] = get_component(case33, goc_case["s_base"])
+
+    return goc_case
+
+def get_buses(case33: dict, s_base: float) -> dict:
     # Bus data from RAW (C.3)
-    goc_case["buses"] = {}
+    buses = {}
     for raw_bus in case33["BUS"]:
         goc_bus = {
             "i": int(raw_bus["I"]),
@@ -182,10 +235,12 @@ def parse_raw(filename: str) -> dict:
             "evhi": float(raw_bus["EVHI"]),
             "evlo": float(raw_bus["EVLO"])
         }
-        goc_case["buses"][int(raw_bus["I"])] = goc_bus
+        buses[int(raw_bus["I"])] = goc_bus
+    return buses
 
+def get_loads(case33: dict, s_base: float) -> dict:
     # Load data from raw (C.4)
-    goc_case["loads"] = {i: {"pl": 0, "ql": 0} for i in goc_case["buses"]}
+    loads = {int(raw_bus["I"]): {"pl": 0, "ql": 0} for raw_bus in case33["BUS"]}
     for raw_load in case33["LOAD"]:
         if int(raw_load["STAT"]) != 1:
             continue
@@ -193,11 +248,13 @@ def parse_raw(filename: str) -> dict:
         pl = float(raw_load["PL"])
         ql = float(raw_load["QL"])
 
-        goc_case["loads"][i]["pl"] = goc_case["loads"][i]["pl"] + pl / goc_case["s_base"] 
-        goc_case["loads"][i]["ql"] = goc_case["loads"][i]["ql"] + ql / goc_case["s_base"] 
+        loads[i]["pl"] = loads[i]["pl"] + pl / s_base
+        loads[i]["ql"] = loads[i]["ql"] + ql / s_base
+    return loads
 
+def get_fixed_shunts(case33: dict, s_base: float) -> dict:
     # Fixed shunt data from raw (C.5)
-    goc_case["fixed_shunts"] = {i: {"gs": 0, "bs": 0} for i in goc_case["buses"]}
+    fixed_shunts = {int(raw_bus["I"]): {"gs": 0, "bs": 0} for raw_bus in case33["BUS"]}
     for raw_shunt in case33["FIXED SHUNT"]:
         if int(raw_shunt["STATUS"]) != 1:
             continue
@@ -205,24 +262,26 @@ def parse_raw(filename: str) -> dict:
         gs = float(raw_shunt["GL"])
         bs = float(raw_shunt["BL"])
 
-        goc_case["fixed_shunts"][i]["gs"] = goc_case["fixed_shunts"][i]["gs"] + gs / goc_case["s_base"]
-        goc_case["fixed_shunts"][i]["bs"] = goc_case["fixed_shunts"][i]["bs"] + bs / goc_case["s_base"]
+        fixed_shunts[i]["gs"] = fixed_shunts[i]["gs"] + gs / s_base
+        fixed_shunts[i]["bs"] = fixed_shunts[i]["bs"] + bs / s_base
+    return fixed_shunts
 
+def get_generators(case33: dict, s_base: float) -> dict:
     # Generator data from raw (C.6)
-    goc_case["generators"] = {}
+    generators = {}
     for raw_generator in case33["GENERATOR"]:
         if int(raw_generator["STAT"]) != 1:
             continue
         i = int(raw_generator["I"])
         g = i, raw_generator["ID"].strip("'").rjust(2, " ")
-        pg = float(raw_generator["PG"]) / goc_case["s_base"]
-        pghi = float(raw_generator["PT"]) / goc_case["s_base"]
-        pglo = float(raw_generator["PB"]) / goc_case["s_base"]
-        qg = float(raw_generator["QG"]) / goc_case["s_base"]
-        qghi = float(raw_generator["QT"]) / goc_case["s_base"]
-        qglo = float(raw_generator["QB"]) / goc_case["s_base"]
-
-        goc_case["generators"][g] = {
+        pg = float(raw_generator["PG"]) / s_base
+        pghi = float(raw_generator["PT"]) / s_base
+        pglo = float(raw_generator["PB"]) / s_base
+        qg = float(raw_generator["QG"]) / s_base
+        qghi = float(raw_generator["QT"]) / s_base
+        qglo = float(raw_generator["QB"]) / s_base
+
+        generators[g] = {
             "g": g,
             "i": i,
             "pg": pg,
@@ -232,9 +291,11 @@ def parse_raw(filename: str) -> dict:
             "pghi": pghi,
             "pglo": pglo
         }
+    return generators
 
+def get_lines(case33: dict, s_base: float) -> dict:
     # Line data from raw (C.7)
-    goc_case["lines"] = {}
+    lines = {}
     for raw_line in case33["BRANCH"]:
         if int(raw_line["STAT"]) != 1:
             continue
@@ -245,10 +306,10 @@ def parse_raw(filename: str) -> dict:
         r = float(raw_line["R"])
         x = float(raw_line["X"])
         b = float(raw_line["B"])
-        rate_a = float(raw_line["RATEA"]) / goc_case["s_base"]
-        rate_c = float(raw_line["RATEC"]) / goc_case["s_base"]
+        rate_a = float(raw_line["RATEA"]) / s_base
+        rate_c = float(raw_line["RATEC"]) / s_base
 
-        goc_case["lines"][e] = {
+        lines[e] = {
             "e": e,
             "i": bus_from,
             "j": bus_to,
@@ -258,9 +319,11 @@ def parse_raw(filename: str) -> dict:
             "rate": rate_a,
             "rate_k": rate_c
         }
+    return lines
 
+def get_transformers(case33: dict, s_base: float) -> dict:
     # Transformer data from raw (C.8)
-    goc_case["transformers"] = {}
+    transformers = {}
     for raw_transformer in case33["TRANSFORMER"]:
         if int(raw_transformer[0]["STAT"]) != 1:
             continue
@@ -278,10 +341,10 @@ def parse_raw(filename: str) -> dict:
         windv1 = float(raw_transformer[2]["WINDV1"])
         windv2 = float(raw_transformer[3]["WINDV2"])
         ang1 = float(raw_transformer[2]["ANG1"])
-        rate_a = float(raw_transformer[2]["RATEA"]) / goc_case["s_base"]
-        rate_c = float(raw_transformer[2]["RATEC"]) / goc_case["s_base"]
+        rate_a = float(raw_transformer[2]["RATEA"]) / s_base
+        rate_c = float(raw_transformer[2]["RATEC"]) / s_base
 
-        goc_case["transformers"][f] = {
+        transformers[f] = {
             "f": f,
             "i": from_bus,
             "j": to_bus,
@@ -294,25 +357,47 @@ def parse_raw(filename: str) -> dict:
             "rate": rate_a,
             "rate_k": rate_c
         }
-    
+    return transformers
+
+def get_switched_shunts(case33: dict, s_base: float) -> dict:
     # switched shunt data from raw (C.9)
-    goc_case["switched_shunts"] = {}
+    switched_shunts = {}
     for raw_shunt in case33["SWITCHED SHUNT"]:
         if int(raw_shunt["ST"]) != 1:
             continue
         i = int(raw_shunt["I"])
-        bs = float(raw_shunt["BINIT"]) / goc_case["s_base"]
+        bs = float(raw_shunt["BINIT"]) / s_base
         b_values = [int(raw_shunt[f"N{x}"]) * float(raw_shunt[f"B{x}"]) for x in range(1, 9)]
-        bshi = sum(max(0, b) for b in b_values) / goc_case["s_base"]
-        bslo = sum(min(0, b) for b in b_values) / goc_case["s_base"]
+        bshi = sum(max(0, b) for b in b_values) / s_base
+        bslo = sum(min(0, b) for b in b_values) / s_base
 
-        goc_case["switched_shunts"][i] = {
+        switched_shunts[i] = {
             "i": i,
             "bs0": bs,
             "bs": bs,
             "bshi": bshi,
             "bslo": bslo
         }
-
-    return goc_case
-
+    return switched_shunts
+
+# GOC component -> builder
+COMPONENTS = {
+    "buses": get_buses,
+    "loads": get_loads,
+    "fixed_shunts": get_fixed_shunts,
+    "generators": get_generators,
+    "lines": get_lines,
+    "transformers": get_transformers,
+    "switched_shunts": get_switched_shunts,
+}
+
+# GOC component -> data blocks it is read from
+COMPONENT_SECTIONS = {
+    "buses": ["BUS"],
+    "loads": ["BUS", "LOAD"],
+    "fixed_shunts": ["BUS", "FIXED SHUNT"],
+    "generators": ["GENERATOR"],
+    "lines": ["BRANCH"],
+    "transformers": ["TRANSFORMER"],
+    "switched_shunts": ["SWITCHED SHUNT"],
+}
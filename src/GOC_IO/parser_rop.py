@@ -1,4 +1,3 @@
-import numpy as np
 import re
 
 def parse_rop(filename:str) -> dict:
@@ -11,7 +10,22 @@ def parse_rop(filename:str) -> dict:
         dict: mapping from `g` (generator identifier) to piecewise linear cost table
 
     Raises:
-        NameError: Invalid filename extension 
+        NameError: Invalid filename extension
+    """
+    sections = split_rop(filename)
+    return build_cost({key: read_section(key, sections[key]) for key in READERS})
+
+def split_rop(filename: str) -> dict:
+    """Split a generator cost data file in its data blocks
+
+    Args:
+        filename (str): path of the generator cost file (*.rop)
+
+    Returns:
+        dict: mapping from block name (`GENERATOR DISPATCH DATA`, ...) to the raw text of the block
+
+    Raises:
+        NameError: Invalid filename extension
     """
     if not filename.endswith(".rop"):
         raise NameError("Invalid filename, `parse_rop` works with *.rop files")
@@ -19,10 +33,39 @@ def parse_rop(filename:str) -> dict:
     with open(filename) as io:
         file = io.read()
 
+    sections = {}
+    key = None
+    for line in file.splitlines():
+        if re.match(r"\s*0\s*/", line):
+            # End of block, optionally followed by the beginning of the next one
+            match_begin = re.search(r"(?<=BEGIN ).*", line)
+            key = match_begin.group().strip() if match_begin else None
+            if key:
+                sections[key] = []
+            continue
+        if key:
+            sections[key].append(line)
+
+    return {key: "\n".join(lines) for key, lines in sections.items()}
+
+def read_section(key: str, section: str) -> dict:
+    """Read the text of a data block
+
+    Args:
+        key (str): block name (see `READERS`)
+        section (str): raw text of the block from `split_rop`
+
+    Returns:
+        dict: block data, None for blocks not used by GOC 1
+    """
+    if key not in READERS:
+        return None
+    return READERS[key](section)
+
+def read_generator_dispatch_data(section: str) -> dict:
     # Generator dispatch data
-    raw_generator_dispatch_data = re.search(r'(?<=BEGIN GENERATOR DISPATCH DATA\n).*(?=0 / END OF GENERATOR DISPATCH DATA)', file, flags=re.S).group()
     generator_dispatch_data = {}
-    for raw_row in raw_generator_dispatch_data.splitlines():
+    for raw_row in section.splitlines():
         row = raw_row.split(",")
         if len(row) != 4:
             continue
@@ -32,11 +75,12 @@ def parse_rop(filename:str) -> dict:
             "id": g,
             "dispatch_table": dsptbl
         }
+    return generator_dispatch_data
 
+def read_active_power_dispatch_tables(section: str) -> dict:
     # Active power dispatch table
-    raw_generator_dispatch_table = re.search(r'(?<=BEGIN ACTIVE POWER DISPATCH TABLES\n).*(?=0 / END OF ACTIVE POWER DISPATCH TABLES)', file, flags=re.S).group()
     generator_dispatch_table = {}
-    for raw_row in raw_generator_dispatch_table.splitlines():
+    for raw_row in section.splitlines():
         row = raw_row.split(",")
         if len(row) != 7:
             continue
@@ -46,12 +90,15 @@ def parse_rop(filename:str) -> dict:
             "table": tbl,
             "cost_curve_table": ctbl
         }
+    return generator_dispatch_table
+
+def read_piece_wise_linear_cost_tables(section: str) -> dict:
+    import numpy as np # deferred, only needed to fit the cost curves
 
     # Piecewise linear cost curve tables
-    raw_piece_wise_linear_cost = re.search(r'(?<=BEGIN PIECE-WISE LINEAR COST TABLES\n).*(?=0 / END OF PIECE-WISE LINEAR COST TABLES)', file, flags=re.S).group()
     piece_wise_linear_cost_table = {}
 
-    lines_piece_wise_linear_cost = raw_piece_wise_linear_cost.splitlines()
+    lines_piece_wise_linear_cost = section.splitlines()
     header = r"[0-9]*,.*,[0-9]*"
 
     current_line = 0
@@ -78,6 +125,27 @@ def parse_rop(filename:str) -> dict:
                 "coefficients": np.polyfit(x, y, 2).tolist(),
             }
         current_line += 1
+    return piece_wise_linear_cost_table
+
+# Block name -> reader, blocks not listed are not used by GOC 1
+READERS = {
+    "GENERATOR DISPATCH DATA": read_generator_dispatch_data,
+    "ACTIVE POWER DISPATCH TABLES": read_active_power_dispatch_tables,
+    "PIECE-WISE LINEAR COST TABLES": read_piece_wise_linear_cost_tables,
+}
+
+def build_cost(data: dict) -> dict:
+    """Mapping from generator to cost table
+
+    Args:
+        data (dict): mapping from block name to block data (see `read_section`)
+
+    Returns:
+        dict: mapping from `g` (generator identifier) to piecewise linear cost table
+    """
+    generator_dispatch_data = data["GENERATOR DISPATCH DATA"]
+    generator_dispatch_table = data["ACTIVE POWER DISPATCH TABLES"]
+    piece_wise_linear_cost_table = data["PIECE-WISE LINEAR COST TABLES"]
 
     # mapping g -> linear cost
     generator_cost = {}
@@ -0,0 +1,134 @@
+from .parser_raw import DATA, HEADERKEYS, MULTILINECOMPONENTS
+
+# Data blocks of a PSSE 33 *.raw file in order
+BLOCKS = [
+    "BUS", "LOAD", "FIXED SHUNT", "GENERATOR", "BRANCH", "TRANSFORMER", "AREA", "TWO-TERMINAL DC",
+    "VSC DC LINE", "IMPEDANCE CORRECTION", "MULTI-TERMINAL DC", "MULTI-SECTION LINE", "ZONE",
+    "INTER-AREA TRANSFER", "OWNER", "FACTS", "SWITCHED SHUNT", "GNE", "INDUCTION MACHINE",
+]
+BLOCKNAMES = {"FACTS": "FACTS DEVICE"}
+
+def write_case(case33: dict, filename: str, titles: tuple = ("", "")):
+    """Write a *.raw file, one data block at a time
+
+    Args:
+        case33 (dict): PSSE 33 structured data (see `read_case`)
+        filename (str): Name of psse *.raw file
+        titles (tuple): the two case title lines (Default: empty)
+
+    Raises:
+       NameError: Invalid filename extension
+    """
+    if not filename.endswith(".raw"):
+        raise NameError("Invalid filename, `write_case` works with *.raw files")
+
+    with open(filename, "w") as f:
+        for section in iter_case(case33, titles):
+            f.write(section)
+
+def write_case_batch(case33: dict, filenames: list, overrides: dict, titles: tuple = ("", "")):
+    """Write one *.raw file per variant of a base case
+
+    The blocks without overrides are formatted once and shared by all the
+    variants, only the overridden fields are formatted for each variant.
+
+    Args:
+        case33 (dict): PSSE 33 structured base case (see `read_case`)
+        filenames (list): Name of the psse *.raw file of each variant
+        overrides (dict): mapping from (block, field), e.g. `("LOAD", "PL")`, to an
+            array with one row per variant and one value per record of the block
+        titles (tuple): the two case title lines (Default: empty)
+
+    Raises:
+       NameError: Invalid filename extension
+       ValueError: Invalid override
+    """
+    for filename in filenames:
+        if not filename.endswith(".raw"):
+            raise NameError("Invalid filename, `write_case_batch` works with *.raw files")
+
+    # Position of the overridden fields in the records of each block
+    fields = {}
+    for key, field in overrides:
+        if key not in BLOCKS or key in MULTILINECOMPONENTS:
+            raise ValueError(f"Overrides are supported for single line data blocks, got {key}")
+        if field not in DATA[key]:
+            raise ValueError(f"{field} is not a field of {key} data")
+        if len(overrides[key, field]) != len(filenames):
+            raise ValueError(f"{key} {field} overrides must have one row per variant")
+        for row in overrides[key, field]:
+            if len(row) != len(case33[key]):
+                raise ValueError(f"{key} {field} overrides must have one value per {key} record")
+        # Quoted fields (ID, CKT, NAME, ...) are quoted in the base case
+        quoted = any((record[field] or "").startswith("'") for record in case33[key])
+        fields.setdefault(key, []).append((field, DATA[key].index(field), quoted))
+
+    base = list(iter_case(case33, titles))
+    rows = {key: [get_row(record, DATA[key]) for record in case33[key]] for key in fields}
+
+    for n, filename in enumerate(filenames):
+        with open(filename, "w") as f:
+            # base[0] is the header, base[k + 1] the block `BLOCKS[k]`
+            f.write(base[0])
+            for k, key in enumerate(BLOCKS):
+                if key not in fields:
+                    f.write(base[k + 1])
+                    continue
+                lines = []
+                for r, row in enumerate(rows[key]):
+                    row = list(row)
+                    for field, index, quoted in fields[key]:
+                        row.extend([""] * (index + 1 - len(row)))
+                        row[index] = get_value(overrides[key, field][n][r], quoted)
+                    lines.append(",".join(row) + "\n")
+                lines.append(get_end_of_block(k))
+                f.write("".join(lines))
+            f.write(base[-1])
+
+def iter_case(case33: dict, titles: tuple = ("", "")):
+    """Format PSSE 33 structured data as *.raw text
+
+    Args:
+        case33 (dict): PSSE 33 structured data (see `read_case`)
+        titles (tuple): the two case title lines (Default: empty)
+
+    Yields:
+        str: the header (with the title lines), the text of each data block of `BLOCKS` and the end of file
+    """
+    header = ",".join(get_row(case33["HEADER"], HEADERKEYS))
+    yield "\n".join([header, *titles]) + "\n"
+
+    for k, key in enumerate(BLOCKS):
+        lines = []
+        for record in case33.get(key, []):
+            if key not in MULTILINECOMPONENTS:
+                lines.append(",".join(get_row(record, DATA[key])) + "\n")
+                continue
+            # Two winding transformers have 4 lines
+            n_lines = 4 if key == "TRANSFORMER" and record[0]["K"] == "0" else len(DATA[key])
+            for sublist, parts in zip(DATA[key][:n_lines], record):
+                lines.append(",".join(get_row(parts, sublist)) + "\n")
+        lines.append(get_end_of_block(k))
+        yield "".join(lines)
+
+    yield "Q\n"
+
+def get_row(component: dict, data: list) -> list:
+    # Values of the fields up to the last one present (see `get_parts`)
+    row = [component[key] for key in data]
+    while row and row[-1] is None:
+        row.pop()
+    return ["" if part is None else part for part in row]
+
+def get_value(value, quoted: bool) -> str:
+    value = str(value)
+    if quoted and not value.startswith("'"):
+        value = f"'{value}'"
+    return value
+
+def get_end_of_block(k: int) -> str:
+    name = BLOCKNAMES.get(BLOCKS[k], BLOCKS[k])
+    if k + 1 == len(BLOCKS):
+        return f"0 / END OF {name} DATA\n"
+    next_name = BLOCKNAMES.get(BLOCKS[k + 1], BLOCKS[k + 1])
+    return f"0 / END OF {name} DATA BEGIN {next_name} DATA\n"
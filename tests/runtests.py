@@ -20,6 +20,12 @@ def test_parser_raw():
     assert data["buses"][1]["vm"] == 1.0400857
     assert data["loads"][1]["pl"] == 21.885521 / 100
 
+def test_read_case():
+    from GOC_IO.parser_raw import read_case
+    case33 = read_case("./tests/scenario_1/case.raw")
+    assert case33["INDUCTION MACHINE"] == []
+    assert len(case33["TRANSFORMER"]) == 193
+
 def test_main():
     network = GOC_IO.parse_data("./tests/scenario_1")
     assert network[1]["generators"][272, " 1"]["contingency"] == True
@@ -36,3 +42,103 @@ def test_write_solution_1():
 
     assert len(solution1.splitlines()) == 658
     assert len(solution2.splitlines()) == 480736
+
+def test_write_solution_2_parallel():
+    network = GOC_IO.parse_data("./tests/scenario_1")
+    network = {i: network[i] for i in range(0, 12)}
+    solution2 = GOC_IO.get_solution_2(network)
+
+    assert GOC_IO.get_solution_2(network, processes=3) == solution2
+
+    import multiprocessing
+    spawn = multiprocessing.get_context("spawn")
+    assert GOC_IO.get_solution_2(network, processes=2, mp_context=spawn) == solution2
+
+def test_write_solution_2_references(monkeypatch):
+    from GOC_IO import main
+    network = GOC_IO.parse_data("./tests/scenario_1")
+    network = {i: network[i] for i in range(0, 12)}
+    calls = []
+    build_references = main.build_references
+    monkeypatch.setattr(main, "build_references", lambda network: calls.append(1) or build_references(network))
+
+    main.get_solution_2(network)
+    assert len(calls) == 1
+
+def test_lazy_import():
+    import subprocess, sys
+    code = "import sys, GOC_IO; assert 'numpy' not in sys.modules and 'GOC_IO.main' not in sys.modules"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+    code = "import sys, GOC_IO.main; assert 'concurrent.futures' not in sys.modules and 'multiprocessing' not in sys.modules"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+def test_cli(tmp_path):
+    from GOC_IO.cli import main
+    assert main(["write", "./tests/scenario_1", "-s", "1", "-o", str(tmp_path)]) == 0
+    assert len((tmp_path / "solution1.txt").read_text().splitlines()) == 658
+
+def test_cli_cache(tmp_path):
+    import pickle
+    from GOC_IO.cli import main
+    assert main(["parse", "./tests/scenario_1", "--cache", "-o", str(tmp_path)]) == 0
+    with open(tmp_path / "case.pkl", "rb") as f:
+        assert pickle.load(f) == GOC_IO.parse_data("./tests/scenario_1")
+
+def test_cli_jobs(tmp_path):
+    import shutil
+    from GOC_IO.cli import main
+    for case in ["a", "b"]:
+        shutil.copytree("./tests/scenario_1", tmp_path / case / "scenario_1")
+    directories = [str(tmp_path / case / "scenario_1") for case in ["a", "b"]]
+    assert main(["write", *directories, "-s", "1", "-j", "2", "-o", str(tmp_path / "out")]) == 0
+    for case in ["a", "b"]:
+        assert len((tmp_path / "out" / case / "scenario_1" / "solution1.txt").read_text().splitlines()) == 658
+
+    with pytest.raises(SystemExit):
+        main(["write", directories[0], directories[0], "-o", str(tmp_path / "out")])
+
+def test_cli_missing_directory(tmp_path):
+    from GOC_IO.cli import main
+    assert main(["parse", "./tests/scenario_1", str(tmp_path / "missing"), "-j", "2"]) == 1
+
+def test_parse_data_incremental(tmp_path):
+    import shutil
+    shutil.copytree("./tests/scenario_1", tmp_path, dirs_exist_ok=True)
+    result = GOC_IO.parse_data_incremental(str(tmp_path))
+    assert result["report"]["rebuilt"]
+
+    raw = (tmp_path / "case.raw").read_text().replace("21.885521", "30.0", 1)
+    (tmp_path / "case.raw").write_text(raw)
+    result = GOC_IO.parse_data_incremental(str(tmp_path), result)
+    assert result["report"]["raw"] == ["LOAD"]
+    assert result["report"]["components"] == ["loads"]
+    assert result["scenarios"][1]["loads"][1]["pl"] == 30.0 / 100
+
+def test_write_case(tmp_path):
+    from GOC_IO.parser_raw import read_case
+    case33 = read_case("./tests/scenario_1/case.raw")
+    GOC_IO.write_case(case33, str(tmp_path / "case.raw"))
+    assert read_case(str(tmp_path / "case.raw")) == case33
+
+def test_write_case_batch(tmp_path):
+    from GOC_IO.parser_raw import read_case
+    case33 = read_case("./tests/scenario_1/case.raw")
+    filenames = [str(tmp_path / f"case_{n}.raw") for n in range(3)]
+    pl = [[n * 10.0] * len(case33["LOAD"]) for n in range(3)]
+    GOC_IO.write_case_batch(case33, filenames, {("LOAD", "PL"): pl})
+
+    data = parse_raw(filenames[2])
+    assert data["loads"][1]["pl"] == 20.0 / 100
+    assert data["buses"][1]["vm"] == 1.0400857
+
+def test_write_case_batch_overrides(tmp_path):
+    from GOC_IO.parser_raw import read_case
+    case33 = read_case("./tests/scenario_1/case.raw")
+    filenames = [str(tmp_path / f"case_{n}.raw") for n in range(2)]
+    with pytest.raises(ValueError):
+        GOC_IO.write_case_batch(case33, filenames, {("LOAD", "PL"): [[0.0], [0.0]]})
+    assert not (tmp_path / "case_0.raw").exists()
+
+    ids = [["A"] * len(case33["GENERATOR"]) for n in range(2)]
+    GOC_IO.write_case_batch(case33, filenames, {("GENERATOR", "ID"): ids})
+    assert (int(case33["GENERATOR"][0]["I"]), " A") in parse_raw(filenames[1])["generators"]